@@ -0,0 +1,71 @@
+#
+#  Copyright (c) 2023 Composiv.ai
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Eclipse Public License v2.0
+# and Eclipse Distribution License v1.0 which accompany this distribution.
+#
+# Licensed under the  Eclipse Public License v2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# The Eclipse Public License is available at
+#    http://www.eclipse.org/legal/epl-v20.html
+# and the Eclipse Distribution License is available at
+#   http://www.eclipse.org/org/documents/edl-v10.php.
+#
+# Contributors:
+#    Composiv.ai - initial API and implementation
+#
+
+"""
+JSON encoding helpers for the Muto Agent system.
+
+Uses orjson when it is installed and falls back to the standard library
+json module otherwise. Both paths return the same Python types.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can
+# catch this for either backend.
+JSONDecodeError = json.JSONDecodeError
+
+
+def dumps(obj: Any) -> str:
+    """
+    Serialize an object to a compact JSON string.
+
+    Args:
+        obj: The object to serialize.
+
+    Returns:
+        str: The JSON document, without spaces after separators.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    # Match orjson's compact output
+    return json.dumps(obj, separators=(",", ":"))
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Deserialize a JSON document.
+
+    Args:
+        data: The JSON document as str or UTF-8 encoded bytes.
+
+    Returns:
+        The decoded Python object.
+
+    Raises:
+        JSONDecodeError: If the document is not valid JSON.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
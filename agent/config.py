@@ -22,15 +22,14 @@
 Configuration management for the Muto Agent system.
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass, field
-import rclpy
 from rclpy.node import Node
 
 from .exceptions import ConfigurationError
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MQTTConfig:
     """Configuration for MQTT connection."""
     host: str = "sandbox.composiv.ai"
@@ -42,22 +41,40 @@ class MQTTConfig:
     prefix: str = "muto"
     name: str = ""
 
-@dataclass
+    def __post_init__(self) -> None:
+        """
+        Validate the connection settings.
+        
+        Raises:
+            ConfigurationError: If a field is out of range or missing.
+        """
+        if self.port < 1 or self.port > 65535:
+            raise ConfigurationError(f"Invalid MQTT port: {self.port}")
+            
+        if self.keep_alive < 1:
+            raise ConfigurationError(f"Invalid MQTT keep_alive: {self.keep_alive}")
+            
+        if not self.host:
+            raise ConfigurationError("MQTT host is required")
+
+@dataclass(frozen=True, slots=True)
 class SymphonyConfig:
     """Configuration for Symphony connection."""
     mqtt: MQTTConfig = field(default_factory=MQTTConfig)
     target: str = "muto-target"
     enabled: bool = False
     topic_prefix: str = "symphony"
-    api_url: str = "http://localhost:8082/v1alpha2/",
-    provider_name: str = "providers.target.mqtt",
-    broker_address: str = "tcp://mosquitto:1883",
-    client_id: str = "symphony",
-    request_topic: str = "coa-request",
-    response_topic: str = "coa-response",
-    timeout_seconds: int = 30,
-    auto_register: bool = False 
-@dataclass
+    api_url: str = "http://localhost:8082/v1alpha2/"
+    provider_name: str = "providers.target.mqtt"
+    broker_address: str = "tcp://mosquitto:1883"
+    client_id: str = "symphony"
+    request_topic: str = "coa-request"
+    response_topic: str = "coa-response"
+    timeout_seconds: int = 30
+    auto_register: bool = False
+
+
+@dataclass(frozen=True, slots=True)
 class TopicConfig:
     """Configuration for ROS topics."""
     stack_topic: str = "stack"
@@ -69,7 +86,7 @@ class TopicConfig:
     thing_messages_topic: str = "thing_messages"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AgentConfig:
     """Main configuration for the Muto Agent."""
     mqtt: MQTTConfig = field(default_factory=MQTTConfig)
@@ -77,6 +94,49 @@ class AgentConfig:
     symphony: SymphonyConfig = field(default_factory=SymphonyConfig)
 
 
+# ROS parameter schema: (config section, field name, parameter name, default).
+# The "symphony_mqtt" section feeds the MQTTConfig nested in SymphonyConfig.
+_PARAMETERS: Tuple[Tuple[str, str, str, Any], ...] = (
+    ("mqtt", "host", "host", "sandbox.composiv.ai"),
+    ("mqtt", "port", "port", 1883),
+    ("mqtt", "keep_alive", "keep_alive", 60),
+    ("mqtt", "user", "user", ""),
+    ("mqtt", "password", "password", ""),
+    ("mqtt", "namespace", "namespace", ""),
+    ("mqtt", "prefix", "prefix", "muto"),
+    ("mqtt", "name", "name", ""),
+
+    ("topics", "stack_topic", "stack_topic", "stack"),
+    ("topics", "twin_topic", "twin_topic", "twin"),
+    ("topics", "agent_to_gateway_topic", "agent_to_gateway_topic", "agent_to_gateway"),
+    ("topics", "gateway_to_agent_topic", "gateway_to_agent_topic", "gateway_to_agent"),
+    ("topics", "agent_to_commands_topic", "agent_to_commands_topic", "agent_to_command"),
+    ("topics", "commands_to_agent_topic", "commands_to_agent_topic", "command_to_agent"),
+    ("topics", "thing_messages_topic", "thing_messages_topic", "thing_messages"),
+
+    ("symphony_mqtt", "host", "symphony_host", "sandbox.composiv.ai"),
+    ("symphony_mqtt", "port", "symphony_port", 1883),
+    ("symphony_mqtt", "keep_alive", "symphony_keep_alive", 60),
+    ("symphony_mqtt", "user", "symphony_user", "admin"),
+    ("symphony_mqtt", "password", "symphony_password", ""),
+    ("symphony_mqtt", "namespace", "symphony_namespace", ""),
+    ("symphony_mqtt", "prefix", "symphony_prefix", "muto"),
+    ("symphony_mqtt", "name", "symphony_name", "muto-device-001"),
+
+    ("symphony", "target", "symphony_target_name", "muto-device-001"),
+    ("symphony", "enabled", "symphony_enabled", False),
+    ("symphony", "topic_prefix", "symphony_topic_prefix", "symphony"),
+    ("symphony", "api_url", "symphony_api_url", "http://localhost:8082/v1alpha2/"),
+    ("symphony", "provider_name", "symphony_provider_name", "providers.target.mqtt"),
+    ("symphony", "broker_address", "symphony_broker_address", "tcp://mosquitto:1883"),
+    ("symphony", "client_id", "symphony_client_id", "symphony"),
+    ("symphony", "request_topic", "symphony_request_topic", "coa-request"),
+    ("symphony", "response_topic", "symphony_response_topic", "coa-response"),
+    ("symphony", "timeout_seconds", "symphony_timeout_seconds", "30"),
+    ("symphony", "auto_register", "symphony_auto_register", False),
+)
+
+
 class ConfigurationManager:
     """
     Manages configuration loading and validation for the Muto Agent system.
@@ -95,74 +155,48 @@ class ConfigurationManager:
         """
         self._node = node
         self._config: Optional[AgentConfig] = None
+        self._parameter_values: Dict[str, Any] = {}
         
-    def load_config(self) -> AgentConfig:
+    def load_config(self, reload: bool = False) -> AgentConfig:
         """
         Load configuration from ROS parameters.
         
+        The configuration is read once and cached; later calls return the
+        cached instance unless a reload is requested.
+        
+        Args:
+            reload: Re-read the ROS parameters even if already loaded.
+        
         Returns:
             AgentConfig: The loaded configuration.
             
         Raises:
             ConfigurationError: If configuration loading fails.
         """
+        if self._config is not None and not reload:
+            return self._config
+        
         try:
             # Declare all parameters with defaults
             self._declare_parameters()
-            
-            # Load MQTT configuration
-            mqtt_config = MQTTConfig(
-                host=self._get_parameter("host", "sandbox.composiv.ai"),
-                port=self._get_parameter("port", 1883),
-                keep_alive=self._get_parameter("keep_alive", 60),
-                user=self._get_parameter("user", ""),
-                password=self._get_parameter("password", ""),
-                namespace=self._get_parameter("namespace", ""),
-                prefix=self._get_parameter("prefix", "muto"),
-                name=self._get_parameter("name", "")
+            self._parameter_values = self._fetch_parameters(
+                [param_name for _, _, param_name, _ in _PARAMETERS]
             )
             
-            sym_mqtt_config = MQTTConfig(
-                host=self._get_parameter("symphony_host", "sandbox.composiv.ai"),
-                port=self._get_parameter("symphony_port", 1883),
-                keep_alive=self._get_parameter("symphony_keep_alive", 60),
-                user=self._get_parameter("symphony_user", ""),
-                password=self._get_parameter("symphony_password", ""),
-                namespace=self._get_parameter("symphony_namespace", ""),
-                prefix=self._get_parameter("symphony_prefix", "muto"),
-                name=self._get_parameter("symphony_name", "")
-            )
+            # Group parameter values by the config section they belong to
+            sections: Dict[str, Dict[str, Any]] = {}
+            for section, field_name, param_name, default in _PARAMETERS:
+                sections.setdefault(section, {})[field_name] = self._get_parameter(param_name, default)
             
-            symphony_config = SymphonyConfig(
-                mqtt=sym_mqtt_config,
-                target=self._get_parameter("symphony_target_name", "muto-target"),
-                enabled=self._get_parameter("symphony_enabled", False),
-                
-                topic_prefix=self._get_parameter("symphony_topic_prefix", "symphony"),
-                api_url=self._get_parameter("symphony_api_url", "http://localhost:8082/v1alpha2/"),
-                provider_name=self._get_parameter("symphony_provider_name", "providers.target.mqtt"),
-                broker_address=self._get_parameter("symphony_broker_address", "tcp://mosquitto:1883"),
-                client_id=self._get_parameter("symphony_client_id", "symphony"),
-                request_topic=self._get_parameter("symphony_request_topic", "coa-request"),
-                response_topic=self._get_parameter("symphony_response_topic", "coa-response"),
-                timeout_seconds=self._get_parameter("symphony_timeout_seconds", 30),
-                auto_register=self._get_parameter("symphony_auto_register", False),
+            self._config = AgentConfig(
+                mqtt=MQTTConfig(**sections["mqtt"]),
+                topics=TopicConfig(**sections["topics"]),
+                symphony=SymphonyConfig(
+                    mqtt=MQTTConfig(**sections["symphony_mqtt"]),
+                    **sections["symphony"]
+                ),
             )
             
-            # Load topic configuration
-            topic_config = TopicConfig(
-                stack_topic=self._get_parameter("stack_topic", "stack"),
-                twin_topic=self._get_parameter("twin_topic", "twin"),
-                agent_to_gateway_topic=self._get_parameter("agent_to_gateway_topic", "agent_to_gateway"),
-                gateway_to_agent_topic=self._get_parameter("gateway_to_agent_topic", "gateway_to_agent"),
-                agent_to_commands_topic=self._get_parameter("agent_to_commands_topic", "agent_to_command"),
-                commands_to_agent_topic=self._get_parameter("commands_to_agent_topic", "command_to_agent"),
-                thing_messages_topic=self._get_parameter("thing_messages_topic", "thing_messages")
-            )
-            
-            self._config = AgentConfig(mqtt=mqtt_config, topics=topic_config, symphony=symphony_config)
-            self._validate_config()
-            
             self._node.get_logger().info("Configuration loaded successfully")
             return self._config
             
@@ -185,51 +219,36 @@ class ConfigurationManager:
     
     def _declare_parameters(self) -> None:
         """Declare all ROS parameters with their default values."""
-        parameters = [
-            ("host", "sandbox.composiv.ai"),
-            ("port", 1883),
-            ("keep_alive", 60),
-            ("user", ""),
-            ("password", ""),
-            ("namespace", ""),
-            ("prefix", "muto"),
-            ("name", ""),
-            ("stack_topic", "stack"),
-            ("twin_topic", "twin"),
-            
-            ("agent_to_gateway_topic", "agent_to_gateway"),
-            ("gateway_to_agent_topic", "gateway_to_agent"),
-            ("agent_to_commands_topic", "agent_to_command"),
-            ("commands_to_agent_topic", "command_to_agent"),
-            ("thing_messages_topic", "thing_messages"),
-
-            ("symphony_enabled", False),
-            ("symphony_host", "sandbox.composiv.ai"),
-            ("symphony_port", 1883),
-            ("symphony_keep_alive", 60),
-            ("symphony_namespace", ""),
-            ("symphony_prefix", "muto"),
-            ('symphony_target_name', 'muto-device-001'),
-            ('symphony_topic_prefix', 'symphony'),
-            ('symphony_enable', False),
-            ('symphony_api_url', 'http://localhost:8082/v1alpha2/'),
-            ('symphony_user', 'admin'),
-            ('symphony_password', ''),
-            ('symphony_name', 'muto-device-001'),
-            ('symphony_provider_name', 'providers.target.mqtt'),
-            ('symphony_broker_address', 'tcp://mosquitto:1883'),
-            ('symphony_client_id', 'symphony'),
-            ('symphony_request_topic', 'coa-request'),
-            ('symphony_response_topic', 'coa-response'),
-            ('symphony_timeout_seconds', '30'),
-            ('symphony_auto_register', False),
+        # Skip names that are already declared (e.g. on reload) so the
+        # batch call does not fail on the first duplicate
+        undeclared = [
+            (param_name, default_value)
+            for _, _, param_name, default_value in _PARAMETERS
+            if not self._node.has_parameter(param_name)
         ]
+        if len(undeclared) < len(_PARAMETERS):
+            self._node.get_logger().debug(
+                f"{len(_PARAMETERS) - len(undeclared)} parameters already declared, skipping them"
+            )
+        if undeclared:
+            self._node.declare_parameters("", undeclared)
+
+    def _fetch_parameters(self, names: List[str]) -> Dict[str, Any]:
+        """
+        Fetch the values of the given parameters in a single call.
         
-        for param_name, default_value in parameters:
-            try:
-                self._node.declare_parameter(param_name, default_value)
-            except rclpy.exceptions.ParameterAlreadyDeclaredException as e:
-                self._node.get_logger().warning(f"Parameter {param_name} already declared: {e}")
+        Args:
+            names: Parameter names to fetch.
+            
+        Returns:
+            Mapping of parameter name to value, empty if the batch lookup fails.
+        """
+        try:
+            parameters = self._node.get_parameters(names)
+            return {name: parameter.value for name, parameter in zip(names, parameters)}
+        except Exception as e:
+            self._node.get_logger().warning(f"Batch parameter lookup failed, falling back to per-name lookup: {e}")
+            return {}
     
     def _get_parameter(self, name: str, default: Any) -> Any:
         """
@@ -242,29 +261,10 @@ class ConfigurationManager:
         Returns:
             The parameter value.
         """
+        if name in self._parameter_values:
+            return self._parameter_values[name]
         try:
             return self._node.get_parameter(name).value
         except Exception:
             self._node.get_logger().warning(f"Failed to get parameter '{name}', using default: {default}")
             return default
-    
-    def _validate_config(self) -> None:
-        """
-        Validate the loaded configuration.
-        
-        Raises:
-            ConfigurationError: If configuration is invalid.
-        """
-        if not self._config:
-            raise ConfigurationError("Configuration is None")
-            
-        # Validate MQTT configuration
-        if self._config.mqtt.port < 1 or self._config.mqtt.port > 65535:
-            raise ConfigurationError(f"Invalid MQTT port: {self._config.mqtt.port}")
-            
-        if self._config.mqtt.keep_alive < 1:
-            raise ConfigurationError(f"Invalid MQTT keep_alive: {self._config.mqtt.keep_alive}")
-            
-        # Validate required fields
-        if not self._config.mqtt.host:
-            raise ConfigurationError("MQTT host is required")
\ No newline at end of file
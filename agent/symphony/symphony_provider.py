@@ -27,9 +27,11 @@ through the Muto platform.
 
 # Standard library imports
 import base64
-import json
+import re
 import signal
 import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple
 
 # Third-party imports
@@ -39,6 +41,7 @@ from rclpy.node import Node
 from std_srvs.srv import Trigger
 
 # Local imports
+from .._fastjson import JSONDecodeError, dumps, loads
 from ..config import ConfigurationManager
 from ..interfaces import BaseNode
 from symphony_sdk import (
@@ -57,6 +60,92 @@ from .provider_base import SymphonyProvider
 from .symphony_broker import MQTTBroker
 
 
+# Leading '{' or '[' marks a plain JSON document
+_JSON_START = re.compile(r"\s*[\[{]")
+
+
+@dataclass(slots=True)
+class RegistryEntry:
+    """State tracked for a component after a successful apply."""
+    component: Dict[str, Any]
+    data: Any
+    payload: Any
+    status: str
+    state: int
+    last_action: str
+
+
+def _attempt_base64_decode(data: str) -> Optional[bytes]:
+    """Try to base64 decode a string, returning None if decoding fails."""
+    try:
+        # Drop whitespace first so wrapped or newline-terminated output
+        # still passes the strict alphabet check
+        return base64.b64decode("".join(data.split()), validate=True)
+    except ValueError:
+        # binascii.Error for bad alphabet/padding, ValueError for non-ASCII
+        return None
+
+
+def _extract_stack_payload(
+    component: ComponentSpec,
+    registry: Dict[str, RegistryEntry],
+    allow_registry_lookup: bool = False
+) -> Tuple[Optional[Any], Optional[str]]:
+    """
+    Extract a JSON payload representing the stack for a component.
+
+    Args:
+        component: The component whose ``data`` property holds the stack.
+        registry: Component registry keyed by component name.
+        allow_registry_lookup: Fall back to the registry when the component
+            carries no usable data.
+
+    Returns:
+        Tuple of (payload, error message); one of them is None.
+    """
+    props = component.properties or {}
+    data = props.get("data")
+
+    if data is None and allow_registry_lookup:
+        registry_entry = registry.get(component.name or "")
+        if registry_entry:
+            return registry_entry.payload, None
+        return None, "Component stack payload not available"
+
+    if isinstance(data, dict):
+        return data, None
+
+    if isinstance(data, (str, bytes)):
+        registry_entry = registry.get(component.name or "")
+        if registry_entry and registry_entry.data == data:
+            # Same raw data as the last apply, reuse its parsed payload
+            return registry_entry.payload, None
+
+    if isinstance(data, bytes):
+        decoded_bytes = data
+    elif isinstance(data, str):
+        if _JSON_START.match(data):
+            # Plain JSON, base64 decoding cannot succeed
+            decoded_bytes = None
+        else:
+            decoded_bytes = _attempt_base64_decode(data)
+    else:
+        if allow_registry_lookup:
+            registry_entry = registry.get(component.name or "")
+            if registry_entry:
+                return registry_entry.payload, None
+        return None, "Unsupported payload format"
+
+    # UnicodeError covers lone surrogates on encode and invalid UTF-8 on
+    # decode; the stdlib parser raises RecursionError on deeply nested data
+    try:
+        if decoded_bytes is None:
+            decoded_bytes = data.encode('utf-8')
+        return loads(decoded_bytes), None
+    except (JSONDecodeError, UnicodeError, RecursionError) as exc:
+        return None, f"Failed to parse stack data: {exc}"
+
+
 class MutoSymphonyProvider(BaseNode, SymphonyProvider):
     """
     Symphony provider integrating with Muto Agent MQTT infrastructure.
@@ -82,12 +171,20 @@ class MutoSymphonyProvider(BaseNode, SymphonyProvider):
         # Configuration
         self._config_manager = config_manager or ConfigurationManager(self)
         self._config = self._config_manager.load_config()
+        # Configuration is immutable, so resolve the target details once
+        self._target_name = self._config.symphony.target
+        self._target_payload = self._build_target_payload()
         
         # MQTT Broker for Symphony communication
         self._mqtt_broker: Optional[MQTTBroker] = None
         
         # Symphony API client
         self._api_client: Optional[SymphonyAPI] = None
+
+        # Runs target registration off the MQTT callback thread
+        self._register_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="symphony_register"
+        )
         
         # Lifecycle management
         self._shutdown_event = threading.Event()
@@ -102,7 +199,7 @@ class MutoSymphonyProvider(BaseNode, SymphonyProvider):
             MutoAction, topics.stack_topic, 10
         )
 
-        self._component_registry: Dict[str, Dict[str, Any]] = {}
+        self._component_registry: Dict[str, RegistryEntry] = {}
     
 
     def _do_initialize(self) -> None:
@@ -182,6 +279,32 @@ class MutoSymphonyProvider(BaseNode, SymphonyProvider):
             self.logger.error(f"Symphony API authentication failed: {e}")
             return None
 
+    def _build_target_payload(self) -> Dict[str, Any]:
+        """Build the Symphony target registration payload from configuration."""
+        symphony = self._config.symphony
+        return {
+            "displayName": self._target_name,
+            "forceRedeploy": True,
+            "topologies": [
+                {
+                    "bindings": [
+                        {
+                            "role": "muto-agent",
+                            "provider": symphony.provider_name,
+                            "config": {
+                                "name": "proxy",
+                                "brokerAddress": symphony.broker_address,
+                                "clientID": symphony.client_id,
+                                "requestTopic": f"{symphony.topic_prefix}/{symphony.request_topic}",
+                                "responseTopic": f"{symphony.topic_prefix}/{symphony.response_topic}",
+                                "timeoutSeconds": symphony.timeout_seconds
+                            }
+                        }
+                    ]
+                }
+            ]
+        }
+
     def register_target(self) -> bool:
         """
         Register this Muto agent as a target in Symphony.
@@ -193,34 +316,8 @@ class MutoSymphonyProvider(BaseNode, SymphonyProvider):
             self.logger.error("Symphony API client not initialized")
             return False
             
-        symphony = self._config.symphony
         try:
-            # Build target registration payload
-            target_payload = {
-                "displayName": symphony.target,
-                "forceRedeploy": True,
-                "topologies": [
-                    {
-                        "bindings": [
-                            {
-                                "role": "muto-agent",
-                                "provider": symphony.provider_name,
-                                "config": {
-                                    "name": "proxy",
-                                    "brokerAddress": symphony.broker_address,
-                                    "clientID": symphony.client_id,
-                                    "requestTopic": f"{symphony.topic_prefix}/{symphony.request_topic}",
-                                    "responseTopic": f"{symphony.topic_prefix}/{symphony.response_topic}",
-                                    "timeoutSeconds": symphony.timeout_seconds
-                                }
-                            }
-                        ]
-                    }
-                ]
-            }
-            
-            # Register target using API client
-            self._api_client.register_target(symphony.target, target_payload)
+            self._api_client.register_target(self._target_name, self._target_payload)
             return True
             
         except SymphonyAPIError as e:
@@ -241,10 +338,9 @@ class MutoSymphonyProvider(BaseNode, SymphonyProvider):
             self.logger.error("Symphony API client not initialized")
             return False
             
-        symphony = self._config.symphony
         try:
             # Unregister target using API client
-            self._api_client.unregister_target(symphony.target, direct=True)
+            self._api_client.unregister_target(self._target_name, direct=True)
             return True
             
         except SymphonyAPIError as e:
@@ -290,9 +386,9 @@ class MutoSymphonyProvider(BaseNode, SymphonyProvider):
         success = self.register_target()
         response.success = success
         if success:
-            response.message = f"Successfully registered target '{self._config.symphony.target}' with Symphony"
+            response.message = f"Successfully registered target '{self._target_name}' with Symphony"
         else:
-            response.message = f"Failed to register target '{self._config.symphony.target}' with Symphony"
+            response.message = f"Failed to register target '{self._target_name}' with Symphony"
         return response
 
     def _unregister_target_service(
@@ -313,9 +409,9 @@ class MutoSymphonyProvider(BaseNode, SymphonyProvider):
         success = self.unregister_target()
         response.success = success
         if success:
-            response.message = f"Successfully unregistered target '{self._config.symphony.target}' from Symphony"
+            response.message = f"Successfully unregistered target '{self._target_name}' from Symphony"
         else:
-            response.message = f"Failed to unregister target '{self._config.symphony.target}' from Symphony"
+            response.message = f"Failed to unregister target '{self._target_name}' from Symphony"
         return response
 
     # SymphonyProvider Interface Methods
@@ -323,9 +419,19 @@ class MutoSymphonyProvider(BaseNode, SymphonyProvider):
 
     def init_provider(self):
         """Initialize the provider - required by MQTTBroker interface."""
-        self.logger.info(f"Muto Symphony Provider initialized - Target: {self._config.symphony.target}")    
-        # Auto-register target after initialization
-        self.register_target()
+        self.logger.info(f"Muto Symphony Provider initialized - Target: {self._target_name}")    
+        if not self._config.symphony.auto_register:
+            self.logger.info("Symphony auto-registration disabled, skipping target registration")
+            return
+        if self._shutdown_event.is_set():
+            return
+        # Auto-register target in the background; this is called from the
+        # MQTT on_connect callback and registration can block until timeout
+        try:
+            self._register_executor.submit(self._auto_register_target)
+        except RuntimeError:
+            # Executor was shut down after the check above
+            self.logger.debug("Provider shutting down, skipping auto-registration")
         
     def apply(
         self, 
@@ -356,7 +462,9 @@ class MutoSymphonyProvider(BaseNode, SymphonyProvider):
         successes = 0
         failures = 0
 
-        target_name = metadata.get("active-target", self.get_target_name())
+        target_name = metadata.get("active-target") or self._target_name
+        registry = self._component_registry
+        local_results: Dict[str, ComponentResultSpec] = {}
 
         for component in components:
             component_name = component.name or "unnamed-component"
@@ -366,12 +474,12 @@ class MutoSymphonyProvider(BaseNode, SymphonyProvider):
 
             component_result = ComponentResultSpec()
 
-            stack_payload, decode_error = self._extract_stack_payload(component)
+            stack_payload, decode_error = _extract_stack_payload(component, registry)
             if decode_error:
                 failures += 1
                 component_result.status = State.UPDATE_FAILED
                 component_result.message = decode_error
-                target_result.component_results[component_name] = component_result
+                local_results[component_name] = component_result
                 self.logger.error(
                     f"Component {component_name} payload error: {decode_error}"
                 )
@@ -390,7 +498,7 @@ class MutoSymphonyProvider(BaseNode, SymphonyProvider):
                 component_result.message = (
                     f"Failed to publish apply action for component {component_name}"
                 )
-                target_result.component_results[component_name] = component_result
+                local_results[component_name] = component_result
                 self.logger.error(component_result.message)
                 # Do NOT update _component_registry on failed publish
                 continue
@@ -401,17 +509,19 @@ class MutoSymphonyProvider(BaseNode, SymphonyProvider):
             component_result.message = (
                 f"Apply action published for component {component_name}"
             )
-            target_result.component_results[component_name] = component_result
+            local_results[component_name] = component_result
 
             # Registry mutation: only performed after successful stack action publish
-            self._component_registry[component_name] = {
-                "component": to_dict(component),
-                "payload": stack_payload,
-                "status": "applied",
-                "state": State.UPDATED.value,
-                "last_action": publish_method,
-            }
+            registry[component_name] = RegistryEntry(
+                component=to_dict(component),
+                data=(component.properties or {}).get("data"),
+                payload=stack_payload,
+                status="applied",
+                state=State.UPDATED.value,
+                last_action=publish_method,
+            )
 
+        target_result.component_results.update(local_results)
         target_result.status = "OK" if failures == 0 else "FAILED"
         if failures:
             target_result.message = (
@@ -427,7 +537,7 @@ class MutoSymphonyProvider(BaseNode, SymphonyProvider):
         target_result.state = SummaryState.DONE
         result.update_target_result(target_name, target_result)
 
-        return json.dumps(result.to_dict(), indent=2)
+        return dumps(result.to_dict())
 
     def remove(
         self, 
@@ -455,7 +565,9 @@ class MutoSymphonyProvider(BaseNode, SymphonyProvider):
         target_result = TargetResultSpec()
         successes = 0
         failures = 0
-        target_name = metadata.get("active-target", self.get_target_name())
+        target_name = metadata.get("active-target") or self._target_name
+        registry = self._component_registry
+        local_results: Dict[str, ComponentResultSpec] = {}
 
         for component in components:
             component_name = component.name or "unnamed-component"
@@ -465,8 +577,9 @@ class MutoSymphonyProvider(BaseNode, SymphonyProvider):
 
             component_result = ComponentResultSpec()
 
-            stack_payload, decode_error = self._extract_stack_payload(
+            stack_payload, decode_error = _extract_stack_payload(
                 component,
+                registry,
                 allow_registry_lookup=True
             )
 
@@ -474,7 +587,7 @@ class MutoSymphonyProvider(BaseNode, SymphonyProvider):
                 failures += 1
                 component_result.status = State.DELETE_FAILED
                 component_result.message = decode_error
-                target_result.component_results[component_name] = component_result
+                local_results[component_name] = component_result
                 self.logger.error(
                     f"Component {component_name} payload error: {decode_error}"
                 )
@@ -493,7 +606,7 @@ class MutoSymphonyProvider(BaseNode, SymphonyProvider):
                 component_result.message = (
                     f"Failed to publish remove action for component {component_name}"
                 )
-                target_result.component_results[component_name] = component_result
+                local_results[component_name] = component_result
                 self.logger.error(component_result.message)
                 # Do NOT modify _component_registry on failed publish
                 continue
@@ -504,11 +617,12 @@ class MutoSymphonyProvider(BaseNode, SymphonyProvider):
             component_result.message = (
                 f"Remove action published for component {component_name}"
             )
-            target_result.component_results[component_name] = component_result
+            local_results[component_name] = component_result
 
             # Registry mutation: only performed after successful stack action publish
-            self._component_registry.pop(component_name, None)
+            registry.pop(component_name, None)
 
+        target_result.component_results.update(local_results)
         target_result.status = "OK" if failures == 0 else "FAILED"
         if failures:
             target_result.message = (
@@ -524,7 +638,7 @@ class MutoSymphonyProvider(BaseNode, SymphonyProvider):
         target_result.state = SummaryState.DONE
         result.update_target_result(target_name, target_result)
 
-        return json.dumps(result.to_dict(), indent=2)
+        return dumps(result.to_dict())
 
     def get(
         self, 
@@ -571,20 +685,13 @@ class MutoSymphonyProvider(BaseNode, SymphonyProvider):
 
             # Successfully retrieved component state from registry
             # Create a copy to avoid external mutation of registry data
-            try:
-                component_info = dict(state_entry["component"])
-                component_info["status"] = state_entry.get("status", "unknown")
-                component_info["state"] = state_entry.get("state", State.NONE.value)
-                component_info["last_action"] = state_entry.get("last_action", "")
-                reported_components.append(component_info)
-            except (KeyError, TypeError) as exc:
-                # Failed to retrieve component state - do not persist stale data
-                self.logger.warning(
-                    f"Failed to retrieve state for component {component_name}: {exc}"
-                )
-                continue
+            component_info = dict(state_entry.component)
+            component_info["status"] = state_entry.status
+            component_info["state"] = state_entry.state
+            component_info["last_action"] = state_entry.last_action
+            reported_components.append(component_info)
 
-        return json.dumps(reported_components, indent=2)
+        return dumps(reported_components)
 
     def _resolve_component_method(
         self,
@@ -621,46 +728,7 @@ class MutoSymphonyProvider(BaseNode, SymphonyProvider):
         allow_registry_lookup: bool = False
     ) -> Tuple[Optional[Any], Optional[str]]:
         """Extract a JSON payload representing the stack for a component."""
-        try:
-            props = component.properties or {}
-            data = props.get("data")
-
-            if data is None and allow_registry_lookup:
-                registry_entry = self._component_registry.get(component.name or "")
-                if registry_entry:
-                    return registry_entry.get("payload"), None
-                return None, "Component stack payload not available"
-
-            if isinstance(data, dict):
-                return data, None
-
-            if isinstance(data, bytes):
-                decoded_bytes = data
-            elif isinstance(data, str):
-                decoded_bytes = self._attempt_base64_decode(data)
-                if decoded_bytes is None:
-                    decoded_bytes = data.encode('utf-8')
-            else:
-                if allow_registry_lookup:
-                    registry_entry = self._component_registry.get(component.name or "")
-                    if registry_entry:
-                        return registry_entry.get("payload"), None
-                return None, "Unsupported payload format"
-
-            payload_str = decoded_bytes.decode('utf-8')
-            return json.loads(payload_str), None
-
-        except json.JSONDecodeError as exc:
-            return None, f"Failed to parse stack data: {exc}"
-        except Exception as exc:
-            return None, f"Unexpected error reading stack payload: {exc}"
-
-    def _attempt_base64_decode(self, data: str) -> Optional[bytes]:
-        """Try to base64 decode a string, returning None if decoding fails."""
-        try:
-            return base64.b64decode(data)
-        except Exception:
-            return None
+        return _extract_stack_payload(component, self._component_registry, allow_registry_lookup)
 
     def _publish_stack_action(
         self,
@@ -674,7 +742,7 @@ class MutoSymphonyProvider(BaseNode, SymphonyProvider):
             return False
 
         try:
-            payload_str = payload if isinstance(payload, str) else json.dumps(payload)
+            payload_str = payload if isinstance(payload, str) else dumps(payload)
 
             msg_action = MutoAction()
             msg_action.context = context
@@ -736,11 +804,11 @@ class MutoSymphonyProvider(BaseNode, SymphonyProvider):
         """Check if components need removal by comparing desired vs current state."""
         self.logger.info(f"Checking removal need for {len(pack.desired)} desired vs {len(pack.current)} current")
         
-        # Create lookup for desired components
-        desired_by_name = {comp.name: comp for comp in pack.desired}
+        # Only membership is needed, so a set of names is enough
+        desired_names = frozenset(comp.name for comp in pack.desired)
         
         for current in pack.current:
-            if current.name not in desired_by_name:
+            if current.name not in desired_names:
                 # Current component not in desired state, needs removal
                 self.logger.info(f"Component {current.name} not desired - needs removal")
                 return True
@@ -798,15 +866,17 @@ class MutoSymphonyProvider(BaseNode, SymphonyProvider):
 
     def _do_cleanup(self) -> None:
         """Stop the Symphony provider."""
+        # Signal other threads and drain any pending registration before the
+        # running check, since cleanup can run without start() having been called
+        self._shutdown_event.set()
+        self._register_executor.shutdown(wait=True, cancel_futures=True)
+
         if not self._running:
             return  # Already cleaned up
             
         self._running = False
         self.logger.info("Stopping Muto Symphony Provider")
         
-        # Set shutdown event first to signal other threads
-        self._shutdown_event.set()
-        
         try:
             # Unregister from Symphony
             self.unregister_target()
@@ -848,7 +918,7 @@ class MutoSymphonyProvider(BaseNode, SymphonyProvider):
 
     def get_target_name(self) -> str:
         """Get the Symphony target name."""
-        return self._config.symphony.target
+        return self._target_name
 
     def get_component_count(self) -> int:
         """Get the number of managed components."""
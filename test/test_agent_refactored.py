@@ -30,6 +30,20 @@ from agent.interfaces import BaseNode
 from muto_msgs.msg import MutoAction, CommandOutput
 
 
+def _make_parameter_node():
+    """Create a mock node that tracks declared parameters in a dict."""
+    declared = {}
+    mock_node = Mock()
+    mock_node.has_parameter.side_effect = declared.__contains__
+    mock_node.declare_parameters.side_effect = (
+        lambda namespace, parameters: declared.update(parameters)
+    )
+    mock_node.get_parameters.side_effect = lambda names: [
+        Mock(value=declared[name]) for name in names
+    ]
+    return mock_node
+
+
 class TestAgentNode(unittest.TestCase):
     @classmethod
     def setUpClass(cls) -> None:
@@ -100,7 +114,41 @@ class TestAgentNode(unittest.TestCase):
         # Test basic config creation
         assert simple_config is not None, "Should be able to create config"
         assert simple_config.mqtt.port == 1883, "Port should be set correctly"
-    
+
+    def test_config_manager_batches_parameter_lookup(self):
+        mock_node = _make_parameter_node()
+
+        config = ConfigurationManager(mock_node).load_config()
+
+        mock_node.get_parameters.assert_called_once()
+        mock_node.get_parameter.assert_not_called()
+        assert config.mqtt.host == "sandbox.composiv.ai", "Host should come from the batched lookup"
+        assert config.mqtt.port == 1883, "Port should come from the batched lookup"
+
+    def test_config_manager_caches_loaded_config(self):
+        mock_node = _make_parameter_node()
+        manager = ConfigurationManager(mock_node)
+
+        config = manager.load_config()
+
+        assert manager.load_config() is config, "Second load should return the cached config"
+        mock_node.get_parameters.assert_called_once()
+
+        manager.load_config(reload=True)
+        mock_node.declare_parameters.assert_called_once()
+        assert mock_node.get_parameters.call_count == 2, "Reload should fetch parameters again"
+
+    def test_mqtt_config_rejects_invalid_values(self):
+        from agent.config import MQTTConfig
+        from agent.exceptions import ConfigurationError
+
+        with self.assertRaises(ConfigurationError):
+            MQTTConfig(port=0)
+        with self.assertRaises(ConfigurationError):
+            MQTTConfig(keep_alive=0)
+        with self.assertRaises(ConfigurationError):
+            MQTTConfig(host="")
+
     def test_parse_topic_via_parser(self):
         # Test parsing via the topic parser directly
         parser = MutoTopicParser()
@@ -0,0 +1,52 @@
+#
+#  Copyright (c) 2023 Composiv.ai
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Eclipse Public License v2.0
+# and Eclipse Distribution License v1.0 which accompany this distribution.
+#
+# Licensed under the  Eclipse Public License v2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# The Eclipse Public License is available at
+#    http://www.eclipse.org/legal/epl-v20.html
+# and the Eclipse Distribution License is available at
+#   http://www.eclipse.org/org/documents/edl-v10.php.
+#
+# Contributors:
+#    Composiv.ai - initial API and implementation
+#
+
+import json
+import unittest
+from unittest.mock import patch
+
+from agent import _fastjson
+
+
+class TestFastJson(unittest.TestCase):
+
+    def _check_round_trip(self):
+        data = {"name": "stack", "nodes": [1, 2, 3], "enabled": True}
+
+        self.assertEqual(json.loads(_fastjson.dumps(data)), data)
+        self.assertEqual(
+            _fastjson.dumps(data),
+            '{"name":"stack","nodes":[1,2,3],"enabled":true}'
+        )
+        self.assertEqual(_fastjson.loads(json.dumps(data)), data)
+        self.assertEqual(_fastjson.loads(json.dumps(data).encode("utf-8")), data)
+
+        with self.assertRaises(_fastjson.JSONDecodeError):
+            _fastjson.loads("{not json")
+
+    def test_round_trip(self):
+        self._check_round_trip()
+
+    def test_round_trip_without_orjson(self):
+        with patch.object(_fastjson, "orjson", None):
+            self._check_round_trip()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,295 @@
+#
+#  Copyright (c) 2023 Composiv.ai
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Eclipse Public License v2.0
+# and Eclipse Distribution License v1.0 which accompany this distribution.
+#
+# Licensed under the  Eclipse Public License v2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# The Eclipse Public License is available at
+#    http://www.eclipse.org/legal/epl-v20.html
+# and the Eclipse Distribution License is available at
+#   http://www.eclipse.org/org/documents/edl-v10.php.
+#
+# Contributors:
+#    Composiv.ai - initial API and implementation
+#
+
+import base64
+import json
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+from symphony_sdk import ComponentSpec, State
+
+from agent import _fastjson
+from agent.config import AgentConfig, SymphonyConfig
+from agent.symphony.symphony_provider import (
+    MutoSymphonyProvider,
+    RegistryEntry,
+    _extract_stack_payload,
+)
+
+
+STACK = {
+    "name": "demo-stack",
+    "nodes": [{"name": "talker", "pkg": "demo_nodes_cpp"}, {"name": "listener", "pkg": "demo_nodes_cpp"}],
+}
+
+
+def _component(data, name="demo"):
+    return ComponentSpec(name=name, properties={"data": data})
+
+
+def _make_provider():
+    # Bypass node construction and set only the attributes the tests use
+    provider = MutoSymphonyProvider.__new__(MutoSymphonyProvider)
+    provider.logger = Mock()
+    provider.stack_publisher = Mock()
+    provider._component_registry = {}
+    provider._target_name = "test-target"
+    return provider
+
+
+def _registry_entry(data, payload):
+    return RegistryEntry(
+        component={"name": "demo"},
+        data=data,
+        payload=payload,
+        status="applied",
+        state=State.UPDATED.value,
+        last_action="apply",
+    )
+
+
+class TestExtractStackPayload(unittest.TestCase):
+
+    def test_plain_json(self):
+        payload, error = _extract_stack_payload(_component(json.dumps(STACK)), {})
+
+        self.assertIsNone(error)
+        self.assertEqual(payload, STACK)
+
+    def test_json_with_leading_whitespace(self):
+        payload, error = _extract_stack_payload(_component("\n  " + json.dumps(STACK)), {})
+
+        self.assertIsNone(error)
+        self.assertEqual(payload, STACK)
+
+    def test_base64(self):
+        encoded = base64.b64encode(json.dumps(STACK).encode("utf-8")).decode("ascii")
+
+        payload, error = _extract_stack_payload(_component(encoded), {})
+
+        self.assertIsNone(error)
+        self.assertEqual(payload, STACK)
+
+    def test_bytes(self):
+        payload, error = _extract_stack_payload(_component(json.dumps(STACK).encode("utf-8")), {})
+
+        self.assertIsNone(error)
+        self.assertEqual(payload, STACK)
+
+    def test_wrapped_base64(self):
+        encoded = base64.encodebytes(json.dumps(STACK).encode("utf-8")).decode("ascii")
+        self.assertIn("\n", encoded.rstrip("\n"), "Encoded data should be line-wrapped")
+
+        payload, error = _extract_stack_payload(_component(encoded), {})
+
+        self.assertIsNone(error)
+        self.assertEqual(payload, STACK)
+
+    def test_base64_with_trailing_newline(self):
+        encoded = base64.b64encode(json.dumps(STACK).encode("utf-8")).decode("ascii") + "\n"
+
+        payload, error = _extract_stack_payload(_component(encoded), {})
+
+        self.assertIsNone(error)
+        self.assertEqual(payload, STACK)
+
+    def test_reuses_registry_payload_for_same_data(self):
+        data = json.dumps(STACK)
+        cached = {"name": "cached"}
+        registry = {"demo": _registry_entry(data, cached)}
+
+        payload, error = _extract_stack_payload(_component(data), registry)
+
+        self.assertIsNone(error)
+        self.assertIs(payload, cached, "Unchanged data should reuse the parsed payload")
+
+    def test_parses_again_when_data_changes(self):
+        registry = {"demo": _registry_entry(json.dumps({"name": "old"}), {"name": "old"})}
+
+        payload, error = _extract_stack_payload(_component(json.dumps(STACK)), registry)
+
+        self.assertIsNone(error)
+        self.assertEqual(payload, STACK)
+
+    def test_registry_fallback_without_data(self):
+        cached = {"name": "cached"}
+        registry = {"demo": _registry_entry(json.dumps(cached), cached)}
+        component = ComponentSpec(name="demo", properties={})
+
+        payload, error = _extract_stack_payload(component, registry, allow_registry_lookup=True)
+        self.assertIsNone(error)
+        self.assertIs(payload, cached)
+
+        payload, error = _extract_stack_payload(component, {}, allow_registry_lookup=True)
+        self.assertIsNone(payload)
+        self.assertEqual(error, "Component stack payload not available")
+
+    def test_invalid_json(self):
+        payload, error = _extract_stack_payload(_component("{not json"), {})
+
+        self.assertIsNone(payload)
+        self.assertTrue(error.startswith("Failed to parse stack data"))
+
+    def test_invalid_utf8(self):
+        data = b'{"name": "\xff"}'
+
+        for backend in (_fastjson.orjson, None):
+            with self.subTest(orjson=backend is not None), \
+                    patch.object(_fastjson, "orjson", backend):
+                payload, error = _extract_stack_payload(_component(data), {})
+
+                self.assertIsNone(payload)
+                self.assertTrue(error.startswith("Failed to parse stack data"))
+
+    def test_lone_surrogate(self):
+        # What a "\\ud800" escape in the request decodes to; not encodable as UTF-8
+        data = '{"name": "\ud800"}'
+
+        payload, error = _extract_stack_payload(_component(data), {})
+
+        self.assertIsNone(payload)
+        self.assertTrue(error.startswith("Failed to parse stack data"))
+
+    def test_deeply_nested_json_without_orjson(self):
+        # The stdlib parser recurses per nesting level
+        data = "[" * 100000 + "]" * 100000
+
+        with patch.object(_fastjson, "orjson", None):
+            payload, error = _extract_stack_payload(_component(data), {})
+
+        self.assertIsNone(payload)
+        self.assertTrue(error.startswith("Failed to parse stack data"))
+
+    def test_unsupported_format(self):
+        payload, error = _extract_stack_payload(_component(42), {})
+
+        self.assertIsNone(payload)
+        self.assertEqual(error, "Unsupported payload format")
+
+
+class TestProviderOperations(unittest.TestCase):
+
+    def setUp(self):
+        self.provider = _make_provider()
+
+    def test_apply_reports_bad_component_without_raising(self):
+        good = _component(json.dumps(STACK), name="good")
+        bad = _component('{"name": "\ud800"}', name="bad")
+
+        result = json.loads(self.provider.apply({}, [good, bad]))
+
+        components = result["targets"]["test-target"]["components"]
+        self.assertEqual(components["good"]["status"], State.UPDATED.value)
+        self.assertEqual(components["bad"]["status"], State.UPDATE_FAILED.value)
+        self.assertIn("good", self.provider._component_registry)
+        self.assertNotIn("bad", self.provider._component_registry)
+
+
+    def test_apply_empty_active_target_uses_configured_target(self):
+        result = json.loads(
+            self.provider.apply({"active-target": ""}, [_component(json.dumps(STACK))])
+        )
+
+        self.assertEqual(list(result["targets"]), ["test-target"])
+
+    def test_apply_uses_explicit_active_target(self):
+        result = json.loads(
+            self.provider.apply({"active-target": "other-target"}, [_component(json.dumps(STACK))])
+        )
+
+        self.assertEqual(list(result["targets"]), ["other-target"])
+
+
+    def test_apply_get_remove_round_trip(self):
+        component = _component(json.dumps(STACK))
+
+        self.provider.apply({}, [component])
+        raw = self.provider.get({}, [])
+
+        # Compact output, without spaces after separators
+        self.assertEqual(raw, json.dumps(json.loads(raw), separators=(",", ":")))
+        reported = json.loads(raw)
+        self.assertEqual(len(reported), 1)
+        self.assertEqual(reported[0]["name"], "demo")
+        self.assertEqual(reported[0]["status"], "applied")
+        self.assertEqual(reported[0]["state"], State.UPDATED.value)
+        self.assertEqual(reported[0]["last_action"], "apply")
+
+        result = json.loads(self.provider.remove({}, [component]))
+
+        self.assertEqual(result["targets"]["test-target"]["components"]["demo"]["status"], State.DELETED.value)
+        self.assertEqual(self.provider._component_registry, {})
+        self.assertEqual(json.loads(self.provider.get({}, [])), [])
+
+
+class TestInitProvider(unittest.TestCase):
+
+    def setUp(self):
+        self.provider = _make_provider()
+        self.provider._config = AgentConfig(symphony=SymphonyConfig(auto_register=True))
+        self.provider._shutdown_event = threading.Event()
+        self.provider._register_executor = ThreadPoolExecutor(max_workers=1)
+        self.provider._mqtt_broker = Mock()
+        self.provider._api_client = Mock()
+        self.provider._target_payload = {"displayName": "test-target"}
+
+    def tearDown(self):
+        self.provider._register_executor.shutdown(wait=True, cancel_futures=True)
+
+    def test_init_provider_registers_in_background(self):
+        release = threading.Event()
+        registered = threading.Event()
+
+        def blocking_register(target_name, target_payload):
+            release.wait(timeout=5)
+            registered.set()
+
+        self.provider._api_client.register_target.side_effect = blocking_register
+
+        self.provider.init_provider()
+
+        # init_provider returned while the API call is still blocked
+        self.assertFalse(registered.is_set())
+
+        release.set()
+        self.assertTrue(registered.wait(timeout=5), "Registration should still run")
+        self.provider._api_client.register_target.assert_called_once_with(
+            "test-target", {"displayName": "test-target"}
+        )
+
+    def test_init_provider_without_auto_register_skips_registration(self):
+        self.provider._config = AgentConfig(symphony=SymphonyConfig(auto_register=False))
+
+        self.provider.init_provider()
+        self.provider._register_executor.shutdown(wait=True)
+
+        self.provider._api_client.register_target.assert_not_called()
+
+    def test_init_provider_after_shutdown_skips_registration(self):
+        self.provider._register_executor.shutdown()
+
+        self.provider.init_provider()
+
+        self.provider._api_client.register_target.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()